@@ -1,34 +1,31 @@
 #!/usr/bin/env python3
 import sys
 import os
+import logging
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from genomic_annotator import AnnotationPipeline, GenomicPosition, create_sample_data
 import pandas as pd
 
 
-def example_single_variant():
+def example_single_variant(pipeline: AnnotationPipeline):
     """Example 1: Annotate a single variant"""
     print("=" * 60)
     print("EXAMPLE 1: Single Variant Annotation")
     print("=" * 60)
     
-    pipeline = AnnotationPipeline()
-    
     # Annotate rs238242 (a well-known variant)
     result = pipeline.run_single_variant("rs238242", show_results=True)
     
     print(f"\nFinal score: {result['scores']['total_score']:.3f}")
 
 
-def example_batch_processing():
+def example_batch_processing(pipeline: AnnotationPipeline):
     """Example 2: Process multiple variants"""
     print("\n" + "=" * 60)
     print("EXAMPLE 2: Batch Processing")
     print("=" * 60)
     
-    pipeline = AnnotationPipeline()
-    
     # List of variants to process
     variants = [
         "rs238242",      # VHL gene variant
@@ -55,7 +52,7 @@ def example_batch_processing():
     print(f"  High-impact variants (score > 0.5): {stats['high_impact_variants']}")
 
 
-def example_csv_processing():
+def example_csv_processing(pipeline: AnnotationPipeline):
     """Example 3: Process variants from CSV file"""
     print("\n" + "=" * 60)
     print("EXAMPLE 3: CSV File Processing") 
@@ -73,7 +70,6 @@ def example_csv_processing():
     print(variants_df.to_string(index=False))
     
     # Process CSV
-    pipeline = AnnotationPipeline()
     results_df = pipeline.run_from_csv(
         input_file=sample_file,
         variant_column="variant_id",
@@ -90,14 +86,12 @@ def example_csv_processing():
     print(results_df[available_cols].to_string(index=False))
 
 
-def example_position_annotation():
+def example_position_annotation(pipeline: AnnotationPipeline):
     """Example 4: Annotate genomic positions"""
     print("\n" + "=" * 60) 
     print("EXAMPLE 4: Position-based Annotation")
     print("=" * 60)
     
-    pipeline = AnnotationPipeline()
-    
     # Annotate a specific genomic position
     result = pipeline.run_position(
         chromosome="chr1",
@@ -109,14 +103,12 @@ def example_position_annotation():
     print("Position annotation completed!")
 
 
-def example_custom_scoring():
+def example_custom_scoring(pipeline: AnnotationPipeline):
     """Example 5: Understanding the scoring system"""
     print("\n" + "=" * 60)
     print("EXAMPLE 5: Understanding Scores")
     print("=" * 60)
     
-    pipeline = AnnotationPipeline()
-    
     # Process a few variants and explain scores
     test_variants = ["rs238242", "rs7527068"]
     
@@ -149,15 +141,20 @@ def example_custom_scoring():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    
     print("Genomic Annotator SDK - Examples")
     print("================================")
     
+    # One pipeline for all examples, so its annotators, cache and connections are reused
+    pipeline = AnnotationPipeline()
+    
     try:
-        example_single_variant()
-        example_batch_processing()
-        example_csv_processing()
-        example_position_annotation()
-        example_custom_scoring()
+        example_single_variant(pipeline)
+        example_batch_processing(pipeline)
+        example_csv_processing(pipeline)
+        example_position_annotation(pipeline)
+        example_custom_scoring(pipeline)
         
         print("\n" + "=" * 60)
         print("ALL EXAMPLES COMPLETED SUCCESSFULLY!")
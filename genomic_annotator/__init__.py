@@ -15,7 +15,8 @@ from .annotator import (
     ClinVarAnnotator,
     ConservationAnnotator,
     VariantScorer,
-    display_results
+    display_results,
+    get_session
 )
 
 from .pipeline import AnnotationPipeline, create_sample_data
@@ -32,6 +33,7 @@ __all__ = [
     "ConservationAnnotator",
     "VariantScorer",
     "display_results",
+    "get_session",
     "create_sample_data"
 ]
 
@@ -2,22 +2,114 @@
 Genomic Annotator - Multi-level variant annotation system
 """
 
+import asyncio
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import os
+import re
+import shelve
+import sys
+import threading
 import time
 import logging
-from typing import Dict, Optional, List, Any, Union
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, List, Any, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
+from urllib.parse import urlparse
+
+try:
+    import orjson  # optional, faster JSON parsing
+except ImportError:
+    orjson = None
 
 # Configuration
-RATE_LIMIT_DELAY = 0.6
+DEFAULT_QPS = 2
+HOST_QPS = {
+    "myvariant.info": 10,
+    "rest.ensembl.org": 15,
+    "eutils.ncbi.nlm.nih.gov": 3,  # raised to NCBI_KEYED_QPS with an API key
+}
+NCBI_KEYED_QPS = 10
 TIMEOUT = 30
+POOL_SIZE = 32
+BATCH_CHUNK_SIZE = 100  # variants per annotate_batch call in a batch run
+CACHE_SIZE = 10000
+DISK_CACHE_SIZE = 100000
+DEFAULT_CACHE_DIR = os.path.expanduser("~/.cache/genomic_annotator")
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 log = logging.getLogger("genomic_annotator")
 
 SESSION = requests.Session()
-SESSION.headers.update({"User-Agent": "GenomicAnnotator/1.0"})
+# All sources answer in JSON. requests (2.26+) already advertises every compression
+# codec urllib3 can decode (gzip, deflate, plus br with the "fast" extra)
+SESSION.headers.update({"User-Agent": "GenomicAnnotator/1.0", "Accept": "application/json"})
+
+# Larger keep-alive pool so parallel annotators reuse connections, plus
+# retries with backoff for transient server errors. POST is retried too:
+# the bulk endpoints use it for read-only queries, so repeating is safe
+_adapter = HTTPAdapter(
+    pool_connections=POOL_SIZE,
+    pool_maxsize=POOL_SIZE,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+    ),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP session used by all annotators"""
+    return SESSION
+
+
+class HostRateLimiter:
+    """Sliding one-second window of request timestamps per host"""
+    
+    def __init__(self, limits: Dict[str, int], default: int = DEFAULT_QPS, window: float = 1.0):
+        for qps in (*limits.values(), default):
+            self._check_qps(qps)
+        self.limits = dict(limits)
+        self.default = default
+        self.window = window
+        self._history: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def set_limit(self, host: str, qps: int):
+        self._check_qps(qps)
+        with self._lock:
+            self.limits[host] = qps
+
+    @staticmethod
+    def _check_qps(qps: int):
+        # acquire() could never admit a request under a limit below 1
+        if qps < 1:
+            raise ValueError(f"Rate limit must be at least 1 request per window, got {qps}")
+
+    def acquire(self, url: str):
+        """Block until a request to the host of `url` fits within its limit"""
+        host = urlparse(url).netloc
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                history = self._history.setdefault(host, deque())
+                while history and now - history[0] >= self.window:
+                    history.popleft()
+                if len(history) < self.limits.get(host, self.default):
+                    history.append(now)
+                    return
+                wait = self.window - (now - history[0])
+            time.sleep(wait)
+
+
+RATE_LIMITER = HostRateLimiter(HOST_QPS)
 
 
 class AnnotationType(Enum):
@@ -26,7 +118,11 @@ class AnnotationType(Enum):
     REGION = "region"
 
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) where supported, Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class GenomicPosition:
     chromosome: str
     position: int
@@ -39,7 +135,7 @@ class GenomicPosition:
         return f"{self.chromosome}:g.{self.position}"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class GenomicRegion:
     chromosome: str
     start: int
@@ -49,7 +145,7 @@ class GenomicRegion:
         return f"{self.chromosome}:{self.start}-{self.end}"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AnnotationResult:
     source: str
     data: Dict[str, Any]
@@ -57,32 +153,172 @@ class AnnotationResult:
     error: Optional[str] = None
 
 
+class AnnotationCache:
+    """In-memory LRU cache, optionally backed by an on-disk shelve store
+    
+    The shelve store holds at most `disk_maxsize` entries; past that, expired
+    and then the oldest entries are dropped. It has no cross-process locking,
+    so a given `path` must only be opened by one process (and one cache) at a time.
+    """
+    
+    def __init__(
+        self,
+        maxsize: int = CACHE_SIZE,
+        path: Optional[str] = None,
+        ttl: Optional[float] = None,
+        disk_maxsize: int = DISK_CACHE_SIZE,
+    ):
+        self.maxsize = maxsize
+        self.disk_maxsize = disk_maxsize
+        self.ttl = ttl
+        self._memory = OrderedDict()
+        self._disk = None
+        self._disk_size = 0
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._disk = shelve.open(path)
+            self._disk_size = len(self._disk)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[AnnotationResult]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None and self._disk is not None:
+                entry = self._disk.get(key)
+            if entry is None:
+                return None
+            
+            stored_at, result = entry
+            if self._expired(stored_at, time.time()):
+                self._forget(key)
+                return None
+            self._remember(key, entry)
+            return result
+
+    def set(self, key: str, result: AnnotationResult):
+        entry = (time.time(), result)
+        with self._lock:
+            self._remember(key, entry)
+            if self._disk is not None:
+                if key not in self._disk:
+                    self._disk_size += 1
+                self._disk[key] = entry
+                if self._disk_size > self.disk_maxsize:
+                    self._prune_disk()
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._disk is not None:
+                self._disk.clear()
+                self._disk_size = 0
+
+    def close(self):
+        """Flush and close the on-disk store; the in-memory tier stays usable"""
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl is not None and now - stored_at > self.ttl
+
+    def _remember(self, key: str, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _forget(self, key: str):
+        self._memory.pop(key, None)
+        if self._disk is not None and key in self._disk:
+            del self._disk[key]
+            self._disk_size -= 1
+
+    def _prune_disk(self):
+        # Pruning reads every entry, so shrink to 90% of the limit to leave
+        # headroom before the next one
+        now = time.time()
+        excess = self._disk_size - int(self.disk_maxsize * 0.9)
+        for stored_at, key in sorted((self._disk[key][0], key) for key in list(self._disk.keys())):
+            if excess <= 0 and not self._expired(stored_at, now):
+                break
+            del self._disk[key]
+            excess -= 1
+        self._disk_size = len(self._disk)
+
+
 class BaseAnnotator:
     """Base class for all annotators"""
     
+    # Seconds a cached result stays valid; None keeps it until evicted
+    cache_ttl: Optional[float] = None
+    
     def __init__(self, name: str, annotation_type: AnnotationType):
         self.name = name
         self.annotation_type = annotation_type
-        self._last_request = 0
-
-    def _rate_limit(self):
-        elapsed = time.time() - self._last_request
-        if elapsed < RATE_LIMIT_DELAY:
-            time.sleep(RATE_LIMIT_DELAY - elapsed)
-        self._last_request = time.time()
+        self.cache = AnnotationCache(ttl=self.cache_ttl)
 
-    def _request(self, url: str, params: Dict = None) -> Optional[Dict]:
+    def _request(self, url: str, params: Dict = None, method: str = "GET", **kwargs) -> Optional[Any]:
         try:
-            self._rate_limit()
-            resp = SESSION.get(url, params=params, timeout=TIMEOUT)
+            RATE_LIMITER.acquire(url)
+            if method == "POST":
+                resp = SESSION.post(url, params=params, timeout=TIMEOUT, **kwargs)
+            else:
+                resp = SESSION.get(url, params=params, timeout=TIMEOUT, **kwargs)
             if resp.status_code == 404:
                 return None
             resp.raise_for_status()
-            return resp.json()
+            return orjson.loads(resp.content) if orjson is not None else resp.json()
         except Exception as e:
-            log.warning(f"Request failed for {url}: {e}")
+            log.warning("Request failed for %s: %s", url, e)
             return None
 
+    def annotate(self, query) -> AnnotationResult:
+        """Annotate a single query, serving successful results from the cache"""
+        key = self._cache_key(query)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._annotate(query)
+            if result.success:
+                self.cache.set(key, result)
+        return result
+
+    def annotate_batch(self, variant_ids: List[str]) -> Dict[str, AnnotationResult]:
+        """Annotate several variants, fetching only those missing from the cache"""
+        results = {}
+        missing = []
+        for variant_id in dict.fromkeys(variant_ids):
+            if not isinstance(variant_id, str):
+                # e.g. NaN from a blank CSV cell; keep the original id as the key
+                results[variant_id] = AnnotationResult(
+                    source=self.name, data={}, success=False, error="Invalid variant id"
+                )
+                continue
+            cached = self.cache.get(self._cache_key(variant_id))
+            if cached is None:
+                missing.append(variant_id)
+            else:
+                results[variant_id] = cached
+        
+        if missing:
+            for variant_id, result in self._annotate_batch(missing).items():
+                if result.success:
+                    self.cache.set(self._cache_key(variant_id), result)
+                results[variant_id] = result
+        
+        return {variant_id: results[variant_id] for variant_id in variant_ids}
+
+    def _cache_key(self, query) -> str:
+        return str(query)
+
+    def _annotate(self, query) -> AnnotationResult:
+        raise NotImplementedError
+
+    def _annotate_batch(self, variant_ids: List[str]) -> Dict[str, AnnotationResult]:
+        """Overridden where the API has a bulk endpoint"""
+        return {variant_id: self._annotate(variant_id) for variant_id in variant_ids}
+
 
 class MyVariantAnnotator(BaseAnnotator):
     """MyVariant.info annotator"""
@@ -90,13 +326,41 @@ class MyVariantAnnotator(BaseAnnotator):
     def __init__(self):
         super().__init__("myvariant", AnnotationType.VARIANT)
         self.base_url = "https://myvariant.info/v1/variant/"
+        self.batch_url = "https://myvariant.info/v1/variant"
+        self.batch_size = 1000  # API maximum ids per POST
         self.fields = "cadd.phred,clinvar,dbnsfp,gnomad_exome.af,gnomad_genome.af"
 
-    def annotate(self, variant_id: str) -> AnnotationResult:
+    def _annotate(self, variant_id: str) -> AnnotationResult:
         url = f"{self.base_url}{variant_id}"
         params = {"fields": self.fields}
         data = self._request(url, params)
+        # An id matching several variants returns a list of hits; keep the
+        # first so this path and _annotate_batch cache the same data
+        if isinstance(data, list):
+            data = data[0] if data else None
+        return self._to_result(data)
+
+    def _annotate_batch(self, variant_ids: List[str]) -> Dict[str, AnnotationResult]:
+        """Annotate variants with one POST per `batch_size` ids"""
+        hits = {}
+        for start in range(0, len(variant_ids), self.batch_size):
+            chunk = variant_ids[start:start + self.batch_size]
+            data = self._request(
+                self.batch_url,
+                method="POST",
+                data={"ids": ",".join(chunk), "fields": self.fields},
+            )
+            for hit in data or []:
+                if not isinstance(hit, dict) or hit.get("notfound"):
+                    continue
+                hit = dict(hit)
+                query = hit.pop("query", hit.get("_id"))
+                # A query can match several hits; keep the first, as _annotate does
+                hits.setdefault(query, hit)
         
+        return {variant_id: self._to_result(hits.get(variant_id)) for variant_id in variant_ids}
+
+    def _to_result(self, data: Optional[Dict]) -> AnnotationResult:
         success = data is not None and not (isinstance(data, dict) and 
                                           all(k.startswith('_') for k in data.keys()))
         
@@ -114,8 +378,10 @@ class EnsemblVEPAnnotator(BaseAnnotator):
     def __init__(self):
         super().__init__("ensembl_vep", AnnotationType.VARIANT)
         self.base_url = "https://rest.ensembl.org/vep/human/id/"
+        self.batch_url = "https://rest.ensembl.org/vep/human/id"
+        self.batch_size = 200  # API maximum ids per POST
 
-    def annotate(self, variant_id: str) -> AnnotationResult:
+    def _annotate(self, variant_id: str) -> AnnotationResult:
         url = f"{self.base_url}{variant_id}"
         params = {"content-type": "application/json"}
         data = self._request(url, params)
@@ -124,6 +390,29 @@ class EnsemblVEPAnnotator(BaseAnnotator):
         if success and isinstance(data, list):
             data = data[0]
 
+        return self._to_result(data, success)
+
+    def _annotate_batch(self, variant_ids: List[str]) -> Dict[str, AnnotationResult]:
+        """Annotate variants with one POST per `batch_size` ids"""
+        hits = {}
+        for start in range(0, len(variant_ids), self.batch_size):
+            chunk = variant_ids[start:start + self.batch_size]
+            data = self._request(
+                self.batch_url,
+                method="POST",
+                json={"ids": chunk},
+            )
+            for hit in data or []:
+                if isinstance(hit, dict):
+                    hits.setdefault(hit.get("input", hit.get("id")), hit)
+        
+        results = {}
+        for variant_id in variant_ids:
+            data = hits.get(variant_id)
+            results[variant_id] = self._to_result(data, data is not None)
+        return results
+
+    def _to_result(self, data: Optional[Dict], success: bool) -> AnnotationResult:
         return AnnotationResult(
             source=self.name,
             data=data or {},
@@ -135,14 +424,26 @@ class EnsemblVEPAnnotator(BaseAnnotator):
 class ClinVarAnnotator(BaseAnnotator):
     """ClinVar annotator"""
     
-    def __init__(self):
+    cache_ttl = 30 * 24 * 3600  # ClinVar is released monthly
+    rsid_pattern = re.compile(r"^rs\d+$", re.IGNORECASE)
+    
+    def __init__(self, api_key: Optional[str] = None):
         super().__init__("clinvar", AnnotationType.VARIANT)
         self.eutils_base = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
+        self.batch_size = 200  # rsIDs OR-ed into one esearch term
+        self.api_key = api_key or os.environ.get("NCBI_API_KEY")
+        if self.api_key:
+            RATE_LIMITER.set_limit(urlparse(self.eutils_base).netloc, NCBI_KEYED_QPS)
+
+    def _params(self, **params) -> Dict[str, Any]:
+        if self.api_key:
+            params["api_key"] = self.api_key
+        return params
 
-    def annotate(self, variant_id: str) -> AnnotationResult:
+    def _annotate(self, variant_id: str) -> AnnotationResult:
         # Search for variant
         search_url = f"{self.eutils_base}esearch.fcgi"
-        search_params = {"db": "clinvar", "term": variant_id, "retmode": "json", "retmax": 5}
+        search_params = self._params(db="clinvar", term=variant_id, retmode="json", retmax=5)
         search_data = self._request(search_url, search_params)
         
         if not search_data or not search_data.get("esearchresult", {}).get("idlist"):
@@ -153,11 +454,67 @@ class ClinVarAnnotator(BaseAnnotator):
         # Get summary
         clinvar_id = search_data["esearchresult"]["idlist"][0]
         summary_url = f"{self.eutils_base}esummary.fcgi"
-        summary_params = {"db": "clinvar", "id": clinvar_id, "retmode": "json"}
+        summary_params = self._params(db="clinvar", id=clinvar_id, retmode="json")
         summary_data = self._request(summary_url, summary_params)
         
         data = summary_data.get("result", {}).get(clinvar_id, {}) if summary_data else {}
+        return self._to_result(data)
+
+    def _annotate_batch(self, variant_ids: List[str]) -> Dict[str, AnnotationResult]:
+        """Look up rsIDs with one esearch + esummary pair per `batch_size` ids"""
+        # Summaries are matched back through their dbSNP cross-references,
+        # so only rsIDs can share a query; anything else is searched alone
+        rsids = [v for v in variant_ids if self._is_rsid(v)]
+        results = {v: self._annotate(v) for v in variant_ids if not self._is_rsid(v)}
+        
+        summaries = {}
+        for start in range(0, len(rsids), self.batch_size):
+            summaries.update(self._summaries_by_rsid(rsids[start:start + self.batch_size]))
+        
+        for rsid in rsids:
+            results[rsid] = self._to_result(summaries.get(rsid.lower(), {}))
+        return results
+
+    def _is_rsid(self, variant_id) -> bool:
+        return isinstance(variant_id, str) and self.rsid_pattern.match(variant_id) is not None
+
+    def _summaries_by_rsid(self, rsids: List[str]) -> Dict[str, Dict]:
+        # Keep the matching ids on the NCBI history server, then fetch all
+        # of their summaries at once
+        search_data = self._request(
+            f"{self.eutils_base}esearch.fcgi",
+            method="POST",
+            data=self._params(db="clinvar", term=" OR ".join(rsids), usehistory="y", retmode="json"),
+        )
+        search = (search_data or {}).get("esearchresult", {})
+        count = int(search.get("count", 0) or 0)
+        if not count or "webenv" not in search:
+            return {}
         
+        summary_data = self._request(
+            f"{self.eutils_base}esummary.fcgi",
+            method="POST",
+            data=self._params(
+                db="clinvar",
+                query_key=search["querykey"],
+                WebEnv=search["webenv"],
+                retmax=min(count, 10000),
+                retmode="json",
+            ),
+        )
+        result = (summary_data or {}).get("result", {})
+        
+        # Keep the first summary per rsID, matching esearch's ordering like _annotate
+        summaries = {}
+        for uid in result.get("uids", []):
+            summary = result.get(uid, {})
+            for variation in summary.get("variation_set", []):
+                for xref in variation.get("variation_xrefs", []):
+                    if xref.get("db_source") == "dbSNP":
+                        summaries.setdefault(f"rs{xref.get('db_id')}", summary)
+        return summaries
+
+    def _to_result(self, data: Dict) -> AnnotationResult:
         return AnnotationResult(
             source=self.name,
             data=data,
@@ -174,7 +531,10 @@ class ConservationAnnotator(BaseAnnotator):
         self.base_url = "https://api.genome.ucsc.edu/getData/track"
         self.track = track_name
 
-    def annotate(self, position: GenomicPosition) -> AnnotationResult:
+    def _cache_key(self, position: GenomicPosition) -> str:
+        return position.to_hgvs()
+
+    def _annotate(self, position: GenomicPosition) -> AnnotationResult:
         params = {
             "genome": "hg38",
             "track": self.track,
@@ -195,57 +555,122 @@ class ConservationAnnotator(BaseAnnotator):
 class VariantScorer:
     """Simple scoring system for variants"""
     
+    # Allele frequency sources, in order of preference
+    frequency_dbs = ("gnomad_exome", "gnomad_genome")
+    # Every key score_variant and score_batch can report in "details"
+    detail_keys = ("cadd_phred", "clinvar_pathogenic", *(f"{db}_af" for db in frequency_dbs), "myvariant_score")
+    
     def score_variant(self, results: Dict[str, AnnotationResult]) -> Dict[str, Any]:
         total_score = 0.0
         details = {}
         
         # MyVariant scoring
         if "myvariant" in results and results["myvariant"].success:
-            data = results["myvariant"].data
+            cadd, pathogenic, af_db, af = self._features(results["myvariant"].data)
             score = 0.0
             
             # CADD score
-            if "cadd" in data and isinstance(data["cadd"], dict):
-                cadd = self._safe_float(data["cadd"].get("phred"))
-                if cadd > 0:
-                    details["cadd_phred"] = cadd
-                    score += min(cadd / 30.0, 0.4)  # Cap at 0.4
+            if cadd is not None and cadd > 0:
+                details["cadd_phred"] = cadd
+                score += min(cadd / 30.0, 0.4)  # Cap at 0.4
             
             # ClinVar significance
-            if "clinvar" in data and isinstance(data["clinvar"], dict):
-                rcv = data["clinvar"].get("rcv", [])
-                if isinstance(rcv, list):
-                    for r in rcv:
-                        if isinstance(r, dict):
-                            sig = str(r.get("clinical_significance", "")).lower()
-                            if "pathogenic" in sig:
-                                score += 0.4
-                                details["clinvar_pathogenic"] = True
-                                break
+            if pathogenic:
+                score += 0.4
+                details["clinvar_pathogenic"] = True
             
             # Frequency (rarer = higher score)
-            for db in ["gnomad_exome", "gnomad_genome"]:
-                if db in data and isinstance(data[db], dict):
-                    af = self._safe_float(data[db].get("af"))
-                    if af is not None:
-                        details[f"{db}_af"] = af
-                        if af == 0:
-                            score += 0.2
-                        elif af < 0.001:
-                            score += 0.15
-                        elif af < 0.01:
-                            score += 0.1
-                        break
+            if af_db is not None:
+                details[f"{af_db}_af"] = af
+                if af == 0:
+                    score += 0.2
+                elif af < 0.001:
+                    score += 0.15
+                elif af < 0.01:
+                    score += 0.1
             
             total_score += score
             details["myvariant_score"] = score
         
         return {"total_score": min(total_score, 1.0), "details": details}
     
+    def score_batch(self, results_list: List[Dict[str, AnnotationResult]]) -> List[Dict[str, Any]]:
+        """Score many variants at once; same output as score_variant for each"""
+        n = len(results_list)
+        has_myvariant = np.zeros(n, dtype=bool)
+        cadd = np.full(n, np.nan)
+        pathogenic = np.zeros(n, dtype=bool)
+        af = np.full(n, np.nan)
+        af_dbs: List[Optional[str]] = [None] * n
+        
+        for i, results in enumerate(results_list):
+            myvariant = results.get("myvariant")
+            if myvariant is None or not myvariant.success:
+                continue
+            has_myvariant[i] = True
+            cadd_i, pathogenic[i], af_dbs[i], af_i = self._features(myvariant.data)
+            if cadd_i is not None:
+                cadd[i] = cadd_i
+            if af_dbs[i] is not None:
+                af[i] = af_i
+        
+        # NaN marks a missing value and fails every comparison below
+        cadd_score = np.where(cadd > 0, np.minimum(cadd / 30.0, 0.4), 0.0)
+        af_score = np.select([af == 0, af < 0.001, af < 0.01], [0.2, 0.15, 0.1], default=0.0)
+        score = cadd_score + 0.4 * pathogenic + af_score
+        total = np.minimum(score, 1.0)
+        
+        scored = []
+        for i in range(n):
+            details = {}
+            if has_myvariant[i]:
+                if cadd[i] > 0:
+                    details["cadd_phred"] = float(cadd[i])
+                if pathogenic[i]:
+                    details["clinvar_pathogenic"] = True
+                if af_dbs[i] is not None:
+                    details[f"{af_dbs[i]}_af"] = float(af[i])
+                details["myvariant_score"] = float(score[i])
+            scored.append({"total_score": float(total[i]), "details": details})
+        return scored
+    
+    def _features(self, data: Dict[str, Any]) -> Tuple[Optional[float], bool, Optional[str], Optional[float]]:
+        """Extract (CADD phred, ClinVar pathogenic, frequency db, allele frequency)"""
+        dig = self._dig
+        cadd = self._safe_float(dig(data, "cadd", "phred"))
+        
+        rcv = dig(data, "clinvar", "rcv")
+        pathogenic = isinstance(rcv, list) and any(
+            "pathogenic" in str(dig(r, "clinical_significance")).lower() for r in rcv
+        )
+        
+        # First database reporting a frequency wins
+        for db in self.frequency_dbs:
+            af = self._safe_float(dig(data, db, "af"))
+            if af is not None:
+                return cadd, pathogenic, db, af
+        return cadd, pathogenic, None, None
+    
+    @staticmethod
+    def _dig(data: Any, *keys: str) -> Any:
+        """Follow `keys` into nested dicts, returning None where the path breaks"""
+        for key in keys:
+            try:
+                data = data[key]
+            except (TypeError, KeyError, IndexError):
+                return None
+        return data
+    
     def _safe_float(self, value, default=None):
+        # Fast paths for the shapes the APIs almost always return
+        cls = value.__class__
+        if cls is float:
+            return value
+        if value is None:
+            return default
+        if cls is int:
+            return float(value)
         try:
-            if value is None:
-                return default
             if isinstance(value, (list, tuple)) and value:
                 return float(value[0])
             return float(value)
@@ -256,7 +681,9 @@ class VariantScorer:
 class GenomicAnnotator:
     """Main annotation pipeline"""
     
-    def __init__(self):
+    def __init__(
+        self, max_workers: int = 3, cache_dir: Optional[str] = None, chunk_size: int = BATCH_CHUNK_SIZE
+    ):
         self.variant_annotators = {
             "myvariant": MyVariantAnnotator(),
             "ensembl_vep": EnsemblVEPAnnotator(),
@@ -266,53 +693,120 @@ class GenomicAnnotator:
             "phylop": ConservationAnnotator("phyloP100way"),
             "phastcons": ConservationAnnotator("phastCons100way"),
         }
+        # Frozen (name, annotator) pairs iterated on every variant
+        self._variant_items = tuple(self.variant_annotators.items())
+        self._position_items = tuple(self.position_annotators.items())
         self.scorer = VariantScorer()
+        if cache_dir:
+            # Persist results across runs, one store per annotator
+            for annotator in (*self.variant_annotators.values(), *self.position_annotators.values()):
+                annotator.cache = AnnotationCache(
+                    path=os.path.join(cache_dir, annotator.name), ttl=annotator.cache_ttl
+                )
+        self.chunk_size = chunk_size
+        # Each annotator talks to its own host, so their calls can overlap
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+    
+    def __del__(self):
+        self.close()
+    
+    def close(self):
+        """Stop the worker threads and close any on-disk caches"""
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+        for _, annotator in (*getattr(self, "_variant_items", ()), *getattr(self, "_position_items", ())):
+            annotator.cache.close()
     
     def annotate_variant(self, variant_id: str) -> Dict[str, AnnotationResult]:
         """Annotate a single variant"""
-        results = {}
-        for name, annotator in self.variant_annotators.items():
-            log.info(f"Annotating {variant_id} with {name}")
-            results[name] = annotator.annotate(variant_id)
-        return results
+        futures = {}
+        for name, annotator in self._variant_items:
+            log.info("Annotating %s with %s", variant_id, name)
+            futures[name] = self._executor.submit(annotator.annotate, variant_id)
+        return {name: future.result() for name, future in futures.items()}
     
     def annotate_position(self, position: GenomicPosition) -> Dict[str, AnnotationResult]:
         """Annotate a genomic position"""
-        results = {}
-        for name, annotator in self.position_annotators.items():
-            log.info(f"Annotating {position.to_hgvs()} with {name}")
-            results[name] = annotator.annotate(position)
-        return results
+        futures = {}
+        hgvs = position.to_hgvs()
+        for name, annotator in self._position_items:
+            log.info("Annotating %s with %s", hgvs, name)
+            futures[name] = self._executor.submit(annotator.annotate, position)
+        return {name: future.result() for name, future in futures.items()}
     
     def score_variant(self, results: Dict[str, AnnotationResult]) -> Dict[str, Any]:
         """Score variant results"""
         return self.scorer.score_variant(results)
     
+    def score_variants_batch(self, results_list: List[Dict[str, AnnotationResult]]) -> List[Dict[str, Any]]:
+        """Score the results of many variants at once"""
+        return self.scorer.score_batch(results_list)
+    
     def annotate_variants_batch(self, variant_ids: List[str]) -> List[Dict[str, Any]]:
-        """Batch annotate multiple variants"""
+        """Batch annotate multiple variants, `chunk_size` at a time"""
         all_results = []
+        chunks = [
+            variant_ids[start:start + self.chunk_size]
+            for start in range(0, len(variant_ids), self.chunk_size)
+        ]
         
-        for variant_id in variant_ids:
-            log.info(f"Processing variant: {variant_id}")
-            
-            # Annotate
-            results = self.annotate_variant(variant_id)
-            
-            # Score
-            scores = self.score_variant(results)
-            
-            # Compile result
-            variant_result = {
-                "variant_id": variant_id,
-                "successful_annotators": [name for name, r in results.items() if r.success],
-                "total_score": scores["total_score"],
-                "score_details": scores["details"],
-                "annotations": {name: r.data for name, r in results.items() if r.success}
-            }
-            
-            all_results.append(variant_result)
+        # Queue one annotate_batch call per (chunk, annotator) up front, so each
+        # worker moves straight on to the next chunk; bulk endpoints are used
+        # where available
+        pending = [
+            {name: self._executor.submit(annotator.annotate_batch, chunk) for name, annotator in self._variant_items}
+            for chunk in chunks
+        ]
+        
+        for i, (chunk, futures) in enumerate(zip(chunks, pending)):
+            log.info("Annotating chunk %d/%d (%d variants)", i + 1, len(chunks), len(chunk))
+            batch_results = {name: future.result() for name, future in futures.items()}
+            all_results.extend(self._compile_chunk(chunk, batch_results))
         
         return all_results
+    
+    async def annotate_variants_batch_async(self, variant_ids: List[str]) -> List[Dict[str, Any]]:
+        """Batch annotate multiple variants without blocking the running event loop"""
+        # Annotators are blocking, so each chunk's bulk calls run on the
+        # executor while the loop awaits them, one chunk at a time
+        loop = asyncio.get_running_loop()
+        all_results = []
+        for start in range(0, len(variant_ids), self.chunk_size):
+            chunk = variant_ids[start:start + self.chunk_size]
+            log.info("Annotating variants %d-%d of %d", start + 1, start + len(chunk), len(variant_ids))
+            annotated = await asyncio.gather(*[
+                loop.run_in_executor(self._executor, annotator.annotate_batch, chunk)
+                for _, annotator in self._variant_items
+            ])
+            batch_results = {name: result for (name, _), result in zip(self._variant_items, annotated)}
+            all_results.extend(self._compile_chunk(chunk, batch_results))
+        return all_results
+    
+    def _compile_chunk(
+        self, chunk: List[str], batch_results: Dict[str, Dict[str, AnnotationResult]]
+    ) -> List[Dict[str, Any]]:
+        # Scored row by row: score_batch measured no faster than this loop
+        return [
+            self._compile_result(variant_id, {name: batch_results[name][variant_id] for name in batch_results})
+            for variant_id in chunk
+        ]
+    
+    def _compile_result(self, variant_id: str, results: Dict[str, AnnotationResult]) -> Dict[str, Any]:
+        scores = self.score_variant(results)
+        successful = []
+        annotations = {}
+        for name, r in results.items():
+            if r.success:
+                successful.append(name)
+                annotations[name] = r.data
+        return {
+            "variant_id": variant_id,
+            "successful_annotators": successful,
+            "total_score": scores["total_score"],
+            "score_details": scores["details"],
+            "annotations": annotations
+        }
 
 
 def display_results(results: Dict[str, AnnotationResult], max_items: int = 3):
@@ -2,15 +2,37 @@
 import pandas as pd
 import logging
 from typing import List, Dict, Any, Optional
-from .annotator import GenomicAnnotator, GenomicPosition, display_results
+from .annotator import GenomicAnnotator, GenomicPosition, VariantScorer, display_results
 
 log = logging.getLogger(__name__)
 
+# Nested MyVariant fields lifted into batch columns, keyed by flattened name
+MYVARIANT_COLUMNS = {
+    "annotations_myvariant_cadd_phred": "cadd_phred",
+    "annotations_myvariant_gnomad_exome_af": "gnomad_af",
+}
+
+# Fixed result columns, so CSV chunks appended to one file line up; the
+# per-annotator "<name>_success" flags follow these
+RESULT_COLUMNS = [
+    "variant_id",
+    "total_score",
+    "successful_annotators",
+    "annotator_names",
+    *(f"score_{key}" for key in VariantScorer.detail_keys),
+    *MYVARIANT_COLUMNS.values(),
+]
+CSV_CHUNK_SIZE = 1000
+
 
 class AnnotationPipeline:
     
-    def __init__(self):
-        self.annotator = GenomicAnnotator()
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.annotator = GenomicAnnotator(cache_dir=cache_dir)
+    
+    def close(self):
+        """Release the annotator's worker threads and on-disk caches"""
+        self.annotator.close()
     
     def run_single_variant(self, variant_id: str, show_results: bool = True) -> Dict[str, Any]:
         
@@ -32,66 +54,81 @@ class AnnotationPipeline:
     
     def run_batch_variants(self, variant_ids: List[str]) -> pd.DataFrame:
         
-        log.info(f"Processing {len(variant_ids)} variants...")
-        results = self.annotator.annotate_variants_batch(variant_ids)
+        # Annotate each distinct id once, then broadcast back in input order
+        unique_ids = list(dict.fromkeys(variant_ids))
+        log.info("Processing %d variants (%d unique)...", len(variant_ids), len(unique_ids))
+        lookup = {r["variant_id"]: r for r in self.annotator.annotate_variants_batch(unique_ids)}
+        results = [lookup[variant_id] for variant_id in variant_ids]
         
-        # Convert to DataFrame
-        df_data = []
+        # Convert to DataFrame; json_normalize expands score details and the
+        # MyVariant fields into columns (score_*, annotations_*) in one pass
+        records = []
         for result in results:
-            row = {
+            mv_data = result["annotations"].get("myvariant", {})
+            successful = result["successful_annotators"]
+            record = {
                 "variant_id": result["variant_id"],
                 "total_score": result["total_score"],
-                "successful_annotators": len(result["successful_annotators"]),
-                "annotator_names": ",".join(result["successful_annotators"]),
+                "successful_annotators": len(successful),
+                "annotator_names": ",".join(successful),
+                "score": result["score_details"],
+                "annotations": {
+                    "myvariant": {"cadd": mv_data.get("cadd"), "gnomad_exome": mv_data.get("gnomad_exome")},
+                },
             }
-            
-            for key, value in result["score_details"].items():
-                row[f"score_{key}"] = value
-            
-          
-            annotations = result["annotations"]
-            if "myvariant" in annotations:
-                mv_data = annotations["myvariant"]
-                if "cadd" in mv_data and isinstance(mv_data["cadd"], dict):
-                    row["cadd_phred"] = mv_data["cadd"].get("phred")
-                
-                if "gnomad_exome" in mv_data and isinstance(mv_data["gnomad_exome"], dict):
-                    row["gnomad_af"] = mv_data["gnomad_exome"].get("af")
-            
-            df_data.append(row)
+            for name in self.annotator.variant_annotators:
+                record[f"{name}_success"] = name in successful
+            records.append(record)
         
-        return pd.DataFrame(df_data)
+        df = pd.json_normalize(records, sep="_", max_level=3)
+        extra = [col for col in df.columns if col.startswith("annotations_") and col not in MYVARIANT_COLUMNS]
+        return df.drop(columns=extra).rename(columns=MYVARIANT_COLUMNS)
     
     def run_from_csv(
         self, 
         input_file: str, 
         variant_column: str = "variant_id",
-        output_file: Optional[str] = None
-    ) -> pd.DataFrame:
-        """Process variants from CSV file"""
-        
-        
-        log.info(f"Loading variants from {input_file}")
-        df_input = pd.read_csv(input_file)
-        
-        if variant_column not in df_input.columns:
-            raise ValueError(f"Column '{variant_column}' not found in {input_file}")
-        
-       
-        variants = df_input[variant_column].tolist()
-        
-       
-        df_results = self.run_batch_variants(variants)
-        
-     
-        df_final = df_input.merge(df_results, on="variant_id", how="left")
-        
-        
-        if output_file:
-            log.info(f"Saving results to {output_file}")
-            df_final.to_csv(output_file, index=False)
+        output_file: Optional[str] = None,
+        chunksize: int = CSV_CHUNK_SIZE,
+        return_results: bool = True
+    ) -> Optional[pd.DataFrame]:
+        """Process variants from CSV file, `chunksize` rows at a time
+        
+        Each chunk is annotated and appended to `output_file` as it completes.
+        Pass return_results=False to skip collecting the full result frame
+        and keep memory bounded by the chunk size.
+        """
+        
+        log.info("Loading variants from %s", input_file)
+        result_columns = RESULT_COLUMNS + [f"{name}_success" for name in self.annotator.variant_annotators]
+        frames = []
+        
+        for i, df_input in enumerate(pd.read_csv(input_file, chunksize=chunksize)):
+            if variant_column not in df_input.columns:
+                raise ValueError(f"Column '{variant_column}' not found in {input_file}")
+            
+            if df_input.empty:
+                # Header-only CSV: nothing to annotate (and merging an empty
+                # result frame fails on mismatched dtypes), so keep the columns
+                columns = [*df_input.columns, *(col for col in result_columns if col not in df_input.columns)]
+                df_final = df_input.reindex(columns=columns)
+            else:
+                # Unique ids keep the merge below one-to-one for repeated variants
+                variants = df_input[variant_column].drop_duplicates().tolist()
+                df_results = self.run_batch_variants(variants).reindex(columns=result_columns)
+
+                df_final = df_input.merge(df_results, left_on=variant_column, right_on="variant_id", how="left")
+            
+            if output_file:
+                log.info("Saving rows %d-%d to %s", i * chunksize, i * chunksize + len(df_final) - 1, output_file)
+                df_final.to_csv(output_file, mode="w" if i == 0 else "a", header=(i == 0), index=False)
+            
+            if return_results:
+                frames.append(df_final)
         
-        return df_final
+        if not return_results:
+            return None
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=result_columns)
     
     def run_position(self, chromosome: str, position: int, ref: str = "", alt: str = "") -> Dict[str, Any]:
      
@@ -116,10 +153,10 @@ class AnnotationPipeline:
         }
         
         # Calculate per-annotator success rates
-        for annotator in ["myvariant", "ensembl_vep", "clinvar"]:
+        for annotator in self.annotator.variant_annotators:
             col_name = f"{annotator}_success"
             if col_name in df.columns:
-                stats["annotator_success_rates"][annotator] = df[col_name].sum() / len(df)
+                stats["annotator_success_rates"][annotator] = df[col_name].mean()
         
         return stats
 
@@ -151,6 +188,8 @@ def create_sample_data():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    
     # Example usage
     pipeline = AnnotationPipeline()
     
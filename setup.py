@@ -18,5 +18,6 @@ setup(
     packages=find_packages(),
     python_requires=">=3.7",
     install_requires=requirements,
+    extras_require={"fast": ["orjson>=3.0", "brotli"]},
     include_package_data=True,
 )
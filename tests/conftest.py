@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+import genomic_annotator.annotator as annotator_module
+
+
+class StubResponse:
+    def __init__(self, data, status_code=200):
+        self._data = data
+        self.status_code = status_code
+        self.content = json.dumps(data).encode()
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class StubSession:
+    """Records requests and answers them from per-URL handlers"""
+
+    def __init__(self):
+        self.calls = []
+        self.handlers = {}
+
+    def route(self, url, handler):
+        self.handlers[url] = handler
+
+    def _dispatch(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        handler = self.handlers.get(url)
+        if handler is None:
+            return StubResponse({}, 404)
+        return StubResponse(handler(**kwargs))
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        return self._dispatch("GET", url, params=params, **kwargs)
+
+    def post(self, url, params=None, timeout=None, **kwargs):
+        return self._dispatch("POST", url, params=params, **kwargs)
+
+
+@pytest.fixture
+def session(monkeypatch):
+    stub = StubSession()
+    monkeypatch.setattr(annotator_module, "SESSION", stub)
+    monkeypatch.setattr(annotator_module, "RATE_LIMITER", annotator_module.HostRateLimiter({}, default=10000))
+    return stub
@@ -0,0 +1,100 @@
+from genomic_annotator import ClinVarAnnotator, EnsemblVEPAnnotator, MyVariantAnnotator, get_session
+
+EUTILS = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
+
+
+def test_myvariant_batch_maps_hits_back_to_queries(session):
+    session.route("https://myvariant.info/v1/variant", lambda data, **_: [
+        {"query": "rs2", "_id": "chr1:g.2A>G", "cadd": {"phred": 12.0}},
+        {"query": "rs1", "_id": "chr1:g.1A>G", "cadd": {"phred": 25.0}},
+        {"query": "rs1", "_id": "chr1:g.1A>T", "cadd": {"phred": 1.0}},
+        {"query": "rs3", "notfound": True},
+    ])
+
+    results = MyVariantAnnotator().annotate_batch(["rs1", "rs2", "rs3"])
+
+    assert list(results) == ["rs1", "rs2", "rs3"]
+    assert results["rs1"].data["cadd"] == {"phred": 25.0}
+    assert "query" not in results["rs1"].data
+    assert results["rs2"].data["_id"] == "chr1:g.2A>G"
+    assert not results["rs3"].success
+    assert len(session.calls) == 1
+
+
+def test_vep_batch_maps_results_by_input(session):
+    session.route("https://rest.ensembl.org/vep/human/id", lambda json, **_: [
+        {"input": "rs2", "id": "rs2", "most_severe_consequence": "intron_variant"},
+        {"input": "rs1", "id": "rs1", "most_severe_consequence": "missense_variant"},
+    ])
+
+    results = EnsemblVEPAnnotator().annotate_batch(["rs1", "rs2", "rs9"])
+
+    assert results["rs1"].data["most_severe_consequence"] == "missense_variant"
+    assert results["rs2"].data["most_severe_consequence"] == "intron_variant"
+    assert not results["rs9"].success
+    assert session.calls[0][2]["json"] == {"ids": ["rs1", "rs2", "rs9"]}
+
+
+def test_clinvar_batch_maps_summaries_through_dbsnp_xrefs(session):
+    def summary(uid, rs):
+        return {"uid": uid, "variation_set": [
+            {"variation_xrefs": [{"db_source": "OMIM", "db_id": "1"}, {"db_source": "dbSNP", "db_id": rs}]}
+        ]}
+
+    session.route(f"{EUTILS}esearch.fcgi", lambda data=None, params=None, **_: (
+        {"esearchresult": {"count": "3", "webenv": "ENV", "querykey": "1", "idlist": []}}
+        if data else {"esearchresult": {"idlist": ["77"]}}
+    ))
+    session.route(f"{EUTILS}esummary.fcgi", lambda data=None, params=None, **_: (
+        {"result": {"uids": ["10", "11", "12"], "10": summary("10", "2"),
+                    "11": summary("11", "1"), "12": summary("12", "1")}}
+        if data else {"result": {"77": {"uid": "77"}}}
+    ))
+
+    results = ClinVarAnnotator().annotate_batch(["rs1", "rs2", "rs3", "NM_000551.3:c.1A>G"])
+
+    assert results["rs1"].data["uid"] == "11"
+    assert results["rs2"].data["uid"] == "10"
+    assert not results["rs3"].success
+    assert results["NM_000551.3:c.1A>G"].data == {"uid": "77"}
+    batch_search = next(kw for method, url, kw in session.calls if method == "POST" and url.endswith("esearch.fcgi"))
+    assert batch_search["data"]["term"] == "rs1 OR rs2 OR rs3"
+
+
+def test_batch_only_fetches_uncached_ids(session):
+    session.route("https://myvariant.info/v1/variant", lambda data, **_: [
+        {"query": v, "cadd": {"phred": 10.0}} for v in data["ids"].split(",")
+    ])
+    annotator = MyVariantAnnotator()
+    annotator.annotate_batch(["rs1", "rs2"])
+
+    annotator.annotate_batch(["rs2", "rs3", "rs3"])
+
+    assert session.calls[-1][2]["data"]["ids"] == "rs3"
+
+
+def test_clinvar_batch_sends_non_string_ids_down_the_single_variant_path(session):
+    session.route(f"{EUTILS}esearch.fcgi", lambda **_: {"esearchresult": {"idlist": []}})
+
+    results = ClinVarAnnotator()._annotate_batch([float("nan"), None])
+
+    assert not any(result.success for result in results.values())
+    assert all(method == "GET" for method, _, _ in session.calls)
+
+
+def test_shared_session_retries_bulk_posts():
+    retry = get_session().get_adapter("https://myvariant.info").max_retries
+
+    assert retry.is_retry("POST", 503)
+    assert retry.is_retry("GET", 503)
+
+
+def test_myvariant_single_and_batch_paths_store_the_same_hit(session):
+    hits = [{"_id": "chr1:g.1A>G", "cadd": {"phred": 25.0}}, {"_id": "chr1:g.1A>T", "cadd": {"phred": 1.0}}]
+    session.route("https://myvariant.info/v1/variant/rs1", lambda **_: hits)
+    session.route("https://myvariant.info/v1/variant", lambda **_: [{"query": "rs1", **hit} for hit in hits])
+
+    single = MyVariantAnnotator().annotate("rs1")
+    batch = MyVariantAnnotator().annotate_batch(["rs1"])["rs1"]
+
+    assert single.data == batch.data == hits[0]
@@ -0,0 +1,87 @@
+import genomic_annotator.annotator as annotator_module
+from genomic_annotator.annotator import AnnotationCache, AnnotationResult, GenomicAnnotator
+
+
+def make_result(source="test"):
+    return AnnotationResult(source=source, data={"x": 1}, success=True)
+
+
+def test_lru_evicts_least_recently_used():
+    cache = AnnotationCache(maxsize=2)
+    first, second, third = make_result("a"), make_result("b"), make_result("c")
+    cache.set("a", first)
+    cache.set("b", second)
+
+    assert cache.get("a") is first  # "a" becomes most recently used
+    cache.set("c", third)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is first
+    assert cache.get("c") is third
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(annotator_module.time, "time", lambda: now[0])
+    cache = AnnotationCache(ttl=60)
+    result = make_result()
+    cache.set("rs1", result)
+
+    now[0] += 59
+    assert cache.get("rs1") is result
+    now[0] += 2
+    assert cache.get("rs1") is None
+
+
+def test_disk_tier_survives_new_instance(tmp_path):
+    path = str(tmp_path / "myvariant")
+    cache = AnnotationCache(path=path)
+    cache.set("rs1", make_result())
+    cache.close()
+
+    reopened = AnnotationCache(path=path)
+
+    assert reopened.get("rs1") == make_result()
+
+
+def test_annotator_close_releases_disk_caches(tmp_path):
+    annotator = GenomicAnnotator(cache_dir=str(tmp_path))
+    caches = [a.cache for a in (*annotator.variant_annotators.values(), *annotator.position_annotators.values())]
+
+    annotator.close()
+
+    assert all(cache._disk is None for cache in caches)
+    assert AnnotationCache(path=str(tmp_path / "myvariant")).get("rs1") is None
+
+
+def test_expired_entries_are_deleted_from_both_tiers(monkeypatch, tmp_path):
+    now = [1000.0]
+    monkeypatch.setattr(annotator_module.time, "time", lambda: now[0])
+    path = str(tmp_path / "clinvar")
+    cache = AnnotationCache(path=path, ttl=60)
+    cache.set("rs1", make_result())
+    cache.close()
+
+    reopened = AnnotationCache(path=path, ttl=60)
+    now[0] += 61
+
+    assert reopened.get("rs1") is None
+    assert "rs1" not in reopened._memory
+    assert "rs1" not in reopened._disk
+
+
+def test_disk_tier_drops_oldest_entries_past_its_limit(monkeypatch, tmp_path):
+    now = [1000.0]
+    monkeypatch.setattr(annotator_module.time, "time", lambda: now[0])
+    path = str(tmp_path / "myvariant")
+    cache = AnnotationCache(maxsize=1, path=path, disk_maxsize=10)
+    for i in range(11):
+        now[0] += 1
+        cache.set(f"rs{i}", make_result())
+    cache.close()
+
+    reopened = AnnotationCache(path=path, disk_maxsize=10)
+
+    assert len(reopened._disk) == 9
+    assert reopened.get("rs0") is None and reopened.get("rs1") is None
+    assert reopened.get("rs10") == make_result()
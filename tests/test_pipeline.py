@@ -0,0 +1,101 @@
+import asyncio
+
+import pandas as pd
+
+from genomic_annotator import AnnotationPipeline, GenomicAnnotator
+from genomic_annotator.pipeline import RESULT_COLUMNS
+
+
+def test_run_from_csv_keeps_rows_with_blank_variant_ids(session, tmp_path):
+    session.route("https://myvariant.info/v1/variant", lambda data, **_: [
+        {"query": v, "cadd": {"phred": 30.0}} for v in data["ids"].split(",")
+    ])
+    input_file = tmp_path / "variants.csv"
+    input_file.write_text("variant_id,sample\nrs1,a\n,b\n")
+
+    df = AnnotationPipeline().run_from_csv(str(input_file))
+
+    assert list(df["sample"]) == ["a", "b"]
+    assert df.loc[0, "myvariant_success"]
+    assert df.loc[1, "total_score"] == 0.0
+    assert df.loc[1, "successful_annotators"] == 0
+
+
+def test_async_batch_matches_sync_batch_and_uses_bulk_endpoints(session):
+    session.route("https://myvariant.info/v1/variant", lambda data, **_: [
+        {"query": v, "cadd": {"phred": 30.0}} for v in data["ids"].split(",")
+    ])
+    variant_ids = ["rs1", "rs2", "rs3"]
+
+    async_results = asyncio.run(GenomicAnnotator().annotate_variants_batch_async(variant_ids))
+    async_calls = list(session.calls)
+    session.calls.clear()
+    sync_results = GenomicAnnotator().annotate_variants_batch(variant_ids)
+
+    assert async_results == sync_results
+    assert sorted(call[:2] for call in async_calls) == sorted(call[:2] for call in session.calls)
+    assert sum(method == "POST" and "myvariant" in url for method, url, _ in async_calls) == 1
+
+
+def test_run_from_csv_appends_chunks_under_one_header(session, tmp_path):
+    session.route("https://myvariant.info/v1/variant", lambda data, **_: [
+        {"query": v, "cadd": {"phred": 30.0}} for v in data["ids"].split(",")
+    ])
+    input_file = tmp_path / "variants.csv"
+    output_file = tmp_path / "annotated.csv"
+    variant_ids = [f"rs{i}" for i in range(10)]
+    input_file.write_text("variant_id,sample\n" + "".join(f"{v},s{i}\n" for i, v in enumerate(variant_ids)))
+
+    df = AnnotationPipeline().run_from_csv(str(input_file), output_file=str(output_file), chunksize=3)
+
+    lines = output_file.read_text().splitlines()
+    assert sum(line.startswith("variant_id,") for line in lines) == 1
+    assert len(lines) == 11
+    written = pd.read_csv(output_file)
+    assert list(written["variant_id"]) == variant_ids
+    assert list(written["sample"]) == [f"s{i}" for i in range(10)]
+    assert list(df["variant_id"]) == variant_ids
+
+
+def test_run_from_csv_with_header_only_returns_empty_frame(session, tmp_path):
+    input_file = tmp_path / "variants.csv"
+    output_file = tmp_path / "annotated.csv"
+    input_file.write_text("variant_id,sample\n")
+
+    df = AnnotationPipeline().run_from_csv(str(input_file), output_file=str(output_file))
+
+    assert df.empty
+    assert list(df.columns[:2]) == ["variant_id", "sample"]
+    assert set(RESULT_COLUMNS) <= set(df.columns)
+    assert "myvariant_success" in df.columns
+    assert list(pd.read_csv(output_file).columns) == list(df.columns)
+    assert session.calls == []
+
+
+def test_batches_are_sent_one_bulk_request_per_chunk_and_annotator(session):
+    session.route("https://myvariant.info/v1/variant", lambda data, **_: [
+        {"query": v, "cadd": {"phred": 30.0}} for v in data["ids"].split(",")
+    ])
+    session.route("https://rest.ensembl.org/vep/human/id", lambda json, **_: [
+        {"input": v, "most_severe_consequence": "missense_variant"} for v in json["ids"]
+    ])
+    session.route("https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi", lambda **_: {
+        "esearchresult": {"count": "0", "idlist": []}
+    })
+    variant_ids = ["rs5", "rs1", "rs4", "rs2", "rs3"]
+
+    sync_results = GenomicAnnotator(chunk_size=2).annotate_variants_batch(variant_ids)
+    sync_posts = [(url, kw) for method, url, kw in session.calls if method == "POST"]
+    session.calls.clear()
+    async_results = asyncio.run(GenomicAnnotator(chunk_size=2).annotate_variants_batch_async(variant_ids))
+
+    assert [r["variant_id"] for r in sync_results] == variant_ids
+    assert async_results == sync_results
+    myvariant_chunks = sorted(kw["data"]["ids"] for url, kw in sync_posts if "myvariant" in url)
+    assert myvariant_chunks == ["rs3", "rs4,rs2", "rs5,rs1"]
+    vep_chunks = sorted(tuple(kw["json"]["ids"]) for url, kw in sync_posts if "ensembl" in url)
+    assert vep_chunks == [("rs3",), ("rs4", "rs2"), ("rs5", "rs1")]
+    assert sum("esearch" in url for url, _ in sync_posts) == 3
+    assert len(sync_posts) == 9
+    # The async path makes the same bulk requests
+    assert sorted(call[:2] for call in session.calls) == sorted(("POST", url) for url, _ in sync_posts)
@@ -0,0 +1,66 @@
+import threading
+import time
+
+import pytest
+
+import genomic_annotator.annotator as annotator_module
+from genomic_annotator.annotator import HostRateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_requests_beyond_the_limit_wait_for_the_window(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(annotator_module, "time", clock)
+    limiter = HostRateLimiter({"api.test": 5})
+
+    admitted = []
+    for _ in range(15):
+        limiter.acquire("https://api.test/v1/variant")
+        admitted.append(clock.now)
+
+    assert admitted == [0.0] * 5 + [1.0] * 5 + [2.0] * 5
+
+
+def test_threaded_requests_are_spread_over_windows():
+    limiter = HostRateLimiter({"api.test": 5}, window=0.2)
+    threads = [threading.Thread(target=limiter.acquire, args=("https://api.test/v1/variant",)) for _ in range(15)]
+
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 15 requests at 5 per window wait out two full windows
+    assert time.monotonic() - start >= 0.4
+
+
+def test_hosts_are_limited_independently(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(annotator_module, "time", clock)
+    limiter = HostRateLimiter({"a.test": 1, "b.test": 1})
+
+    limiter.acquire("https://a.test/x")
+    limiter.acquire("https://b.test/x")
+
+    assert clock.now == 0.0
+
+
+@pytest.mark.parametrize("qps", [0, -1])
+def test_limits_below_one_are_rejected(qps):
+    with pytest.raises(ValueError):
+        HostRateLimiter({"a.test": qps})
+    with pytest.raises(ValueError):
+        HostRateLimiter({}, default=qps)
+    with pytest.raises(ValueError):
+        HostRateLimiter({}).set_limit("a.test", qps)
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from genomic_annotator import AnnotationResult, VariantScorer
+
+
+VALUES = [0, 0.0, 0.0005, 0.005, 0.5, 25.0, 12, [30.0], [], None, "bad", "0.002", True, {"af": 0.1}]
+
+
+def random_results(rng):
+    data = {}
+    if rng.random() < 0.8:
+        data["cadd"] = rng.choice([{"phred": rng.choice(VALUES)}, "x", [1], None, {}])
+    if rng.random() < 0.6:
+        rcv = rng.choice([
+            [{"clinical_significance": rng.choice(["Pathogenic", "Benign", "Likely pathogenic", None, 5])}, "s"],
+            {"clinical_significance": "Pathogenic"},
+            ["s", {"clinical_significance": "Benign"}, {"x": 1}],
+            "str",
+            None,
+        ])
+        data["clinvar"] = rng.choice([{"rcv": rcv}, "x", {}])
+    for db in ("gnomad_exome", "gnomad_genome"):
+        if rng.random() < 0.5:
+            data[db] = rng.choice([{"af": rng.choice(VALUES)}, "x", [0.1], None])
+    if rng.random() < 0.05:
+        return {}
+    return {"myvariant": AnnotationResult("myvariant", data, rng.random() < 0.9)}
+
+
+def test_score_batch_matches_score_variant():
+    rng = random.Random(0)
+    scorer = VariantScorer()
+    results_list = [random_results(rng) for _ in range(20000)]
+
+    batch = scorer.score_batch(results_list)
+
+    assert len(batch) == len(results_list)
+    for results, scored in zip(results_list, batch):
+        assert scored == scorer.score_variant(results)
+        assert set(scored["details"]) <= set(VariantScorer.detail_keys)
+
+
+@pytest.mark.parametrize("data, expected_total, expected_details", [
+    (
+        {"cadd": {"phred": 24.0}, "clinvar": {"rcv": [{"clinical_significance": "Pathogenic"}]},
+         "gnomad_exome": {"af": 0.0005}},
+        0.4 + 0.4 + 0.15,
+        {"cadd_phred": 24.0, "clinvar_pathogenic": True, "gnomad_exome_af": 0.0005,
+         "myvariant_score": 0.4 + 0.4 + 0.15},
+    ),
+    (
+        {"cadd": {"phred": [6.0]}, "gnomad_exome": {"af": None}, "gnomad_genome": {"af": 0}},
+        0.2 + 0.2,
+        {"cadd_phred": 6.0, "gnomad_genome_af": 0.0, "myvariant_score": 0.2 + 0.2},
+    ),
+    (
+        {"cadd": {"phred": 40.0}, "clinvar": {"rcv": [{"clinical_significance": "Likely pathogenic"}]},
+         "gnomad_exome": {"af": 0}},
+        1.0,
+        {"cadd_phred": 40.0, "clinvar_pathogenic": True, "gnomad_exome_af": 0.0,
+         "myvariant_score": 0.4 + 0.4 + 0.2},
+    ),
+    ({}, 0.0, {"myvariant_score": 0.0}),
+])
+def test_score_variant_known_values(data, expected_total, expected_details):
+    scored = VariantScorer().score_variant({"myvariant": AnnotationResult("myvariant", data, True)})
+
+    assert scored["total_score"] == pytest.approx(expected_total)
+    assert scored["details"] == pytest.approx(expected_details)
+
+
+def test_failed_myvariant_result_scores_zero():
+    scored = VariantScorer().score_variant({"myvariant": AnnotationResult("myvariant", {}, False)})
+
+    assert scored == {"total_score": 0.0, "details": {}}